@@ -12,6 +12,8 @@
 # Dependencies:
 # - Pillow (optional, required only if you want PNG sprites)
 #     pip3 install pillow
+# - NumPy (optional, vectorizes sprite rasterization; pure-Python fallback kept)
+#     pip3 install numpy
 #
 # Usage examples:
 #   ./newSimONE.py --planet-png planet.png --sat-png sat.png --force-256 --smooth-level 4
@@ -31,12 +33,16 @@ import sys
 import time
 import tty
 import termios
-import select
+import selectors
 import signal
 import shutil
 import math
 import argparse
 import re
+import functools
+import array
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Try to import Pillow (optional)
@@ -46,6 +52,44 @@ try:
 except Exception:
     PIL_AVAILABLE = False
 
+# Try to import NumPy (optional, used to vectorize sprite rasterization)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
+# Try to import Numba (optional, JIT-compiles the per-color kernels; needs NumPy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except Exception:
+    NUMBA_AVAILABLE = False
+
+# Try to import cykooz.resizer (optional, SIMD Lanczos resize; ~3-10x over
+# Pillow's scalar C loop on the resample that dominates sprite (re)loads)
+try:
+    from cykooz.resizer import Resizer, ResizeAlg, FilterType
+    CYKOOZ_AVAILABLE = True
+    # filter weight tables inside the Resizer are reusable across calls,
+    # so keep a single instance at module scope
+    _resizer = Resizer(ResizeAlg.convolution(FilterType.lanczos3))
+except Exception:
+    CYKOOZ_AVAILABLE = False
+    _resizer = None
+
+
+def resize_rgba(im, new_w, new_h):
+    """Resize an RGBA image with the fastest available Lanczos implementation."""
+    if CYKOOZ_AVAILABLE:
+        try:
+            dst = Image.new("RGBA", (new_w, new_h))
+            _resizer.resize_pil(im, dst)
+            return dst
+        except Exception:
+            pass
+    return im.resize((new_w, new_h), resample=Image.LANCZOS)
+
 # -----------------------
 # Command-line arguments
 # -----------------------
@@ -67,6 +111,7 @@ def parse_args():
 args = parse_args()
 SMOOTH_LEVEL = max(1, int(args.smooth_level))
 HOLD_TIMEOUT = max(0.01, float(args.hold_timeout))
+HOLD_TIMEOUT_NS = int(HOLD_TIMEOUT * 1e9)
 
 # -----------------------
 # ANSI helpers & detection
@@ -79,6 +124,7 @@ CURSOR_HOME = CSI + "H"
 RESET = CSI + "0m"
 
 FRAME_MS = 50  # ~20 FPS target
+FRAME_NS = FRAME_MS * 1_000_000
 
 resized = False
 def sigwinch(signum, frame):
@@ -137,11 +183,19 @@ else:
 # -----------------------
 # Color output implementations
 # -----------------------
+# All cell builders return pre-encoded bytes: the frame is assembled as a
+# bytes buffer and written once, so no per-frame str -> UTF-8 pass is needed
+# over the (pure ASCII) escape sequences.
+CURSOR_HOME_B = CURSOR_HOME.encode("ascii")
+RESET_B = RESET.encode("ascii")
+
+@functools.lru_cache(maxsize=4096)
 def bg_color_block_true(r,g,b):
-    return f"\x1b[48;2;{r};{g};{b}m \x1b[0m"
+    return f"\x1b[48;2;{r};{g};{b}m \x1b[0m".encode("utf-8")
+@functools.lru_cache(maxsize=4096)
 def fg_on_bg_char_true(fg,bg,ch=" "):
     fr,fgc,fb = fg; br,bg2,bb = bg
-    return f"\x1b[48;2;{br};{bg2};{bb}m\x1b[38;2;{fr};{fgc};{fb}m{ch}{RESET}"
+    return f"\x1b[48;2;{br};{bg2};{bb}m\x1b[38;2;{fr};{fgc};{fb}m{ch}{RESET}".encode("utf-8")
 
 def rgb_to_ansi256(r,g,b):
     def clamp255(v): return max(0, min(255, int(v)))
@@ -158,22 +212,55 @@ def rgb_to_ansi256(r,g,b):
     dg = (r-gray_r)**2 + (g-gray_g)**2 + (b-gray_b)**2
     return cube_code if dc <= dg else 232 + gray_level
 
-_bg_cache = {}
-_fg_on_bg_cache = {}
+if NUMBA_AVAILABLE:
+    # Native-code version of the same arithmetic (no nested helpers so the
+    # whole body compiles in nopython mode). Shadows the Python definition,
+    # which stays above as the no-Numba fallback.
+    @njit(cache=True)
+    def _rgb_to_ansi256_jit(r, g, b):
+        r = 0 if r < 0 else (255 if r > 255 else int(r))
+        g = 0 if g < 0 else (255 if g > 255 else int(g))
+        b = 0 if b < 0 else (255 if b > 255 else int(b))
+        ri = int(round((r / 255.0) * 5.0))
+        gi = int(round((g / 255.0) * 5.0))
+        bi = int(round((b / 255.0) * 5.0))
+        cube_code = 16 + 36 * ri + 6 * gi + bi
+        cube_r = 0 if ri == 0 else 55 + 40 * ri
+        cube_g = 0 if gi == 0 else 55 + 40 * gi
+        cube_b = 0 if bi == 0 else 55 + 40 * bi
+        gray_level = int(round(((r + g + b) / 3.0) / 255.0 * 23.0))
+        gray_val = 8 + gray_level * 10
+        dc = (r - cube_r) ** 2 + (g - cube_g) ** 2 + (b - cube_b) ** 2
+        dg = (r - gray_val) ** 2 + (g - gray_val) ** 2 + (b - gray_val) ** 2
+        return cube_code if dc <= dg else 232 + gray_level
+    rgb_to_ansi256 = _rgb_to_ansi256_jit
+
+# Coarse 32x32x32 LUT (32 KB) mapping quantized RGB -> ANSI-256 code, built
+# once at import. Per-call lookup is a single bytes index instead of the
+# branchy arithmetic in rgb_to_ansi256 plus a dict probe.
+_ANSI256_LUT = bytes(rgb_to_ansi256(r*8, g*8, b*8)
+                     for r in range(32) for g in range(32) for b in range(32))
+
+def ansi256_code(r,g,b):
+    return _ANSI256_LUT[((r>>3)<<10)|((g>>3)<<5)|(b>>3)]
+
+def ansi_bg256(code):
+    # direct int-to-ASCII byte concatenation; no f-string machinery and no
+    # UTF-8 pass over what is already ASCII
+    return b"\x1b[48;5;" + str(code).encode("ascii") + b"m \x1b[0m"
+
+# every possible 256-color escape prebuilt once at import; the per-call
+# cost of the cell builders collapses to LUT + table indexing
+BG256 = [ansi_bg256(c) for c in range(256)]
+_BG256_PREFIX = [b"\x1b[48;5;" + str(c).encode("ascii") + b"m" for c in range(256)]
+_FG256_PREFIX = [b"\x1b[38;5;" + str(c).encode("ascii") + b"m" for c in range(256)]
+
 def bg_color_block_256(r,g,b):
-    key=(r,g,b)
-    if key in _bg_cache: return _bg_cache[key]
-    code = rgb_to_ansi256(r,g,b)
-    esc = f"\x1b[48;5;{code}m \x1b[0m"
-    _bg_cache[key] = esc
-    return esc
+    return BG256[_ANSI256_LUT[((r>>3)<<10)|((g>>3)<<5)|(b>>3)]]
+@functools.lru_cache(maxsize=4096)
 def fg_on_bg_char_256(fg,bg,ch=" "):
-    key=(fg,bg,ch)
-    if key in _fg_on_bg_cache: return _fg_on_bg_cache[key]
-    fcode = rgb_to_ansi256(*fg); bcode = rgb_to_ansi256(*bg)
-    esc = f"\x1b[48;5;{bcode}m\x1b[38;5;{fcode}m{ch}{RESET}"
-    _fg_on_bg_cache[key] = esc
-    return esc
+    return (_BG256_PREFIX[ansi256_code(*bg)] + _FG256_PREFIX[ansi256_code(*fg)]
+            + ch.encode("utf-8") + RESET_B)
 
 ANSI16 = [
     ((0,0,0),30,40), ((128,0,0),31,41), ((0,128,0),32,42), ((128,128,0),33,43),
@@ -190,22 +277,59 @@ def nearest_ansi16_code(rgb):
         if best_d is None or d<best_d:
             best_d=d; best=(fg_code,bg_code)
     return best
-_bg_cache16 = {}
-_fg_cache16 = {}
+
+if NUMBA_AVAILABLE:
+    # palette as parallel ndarrays so the distance scan can be typed by Numba
+    _ANSI16_RGB = np.array([c for c, _, _ in ANSI16], dtype=np.int64)
+    _ANSI16_FG = np.array([f for _, f, _ in ANSI16], dtype=np.int64)
+    _ANSI16_BG = np.array([bb for _, _, bb in ANSI16], dtype=np.int64)
+
+    @njit(cache=True)
+    def _nearest_ansi16_jit(r, g, b, pal, fg_codes, bg_codes):
+        best = 0
+        best_d = 1 << 30
+        for i in range(pal.shape[0]):
+            d = (r - pal[i, 0]) ** 2 + (g - pal[i, 1]) ** 2 + (b - pal[i, 2]) ** 2
+            if d < best_d:
+                best_d = d
+                best = i
+        return fg_codes[best], bg_codes[best]
+
+    def nearest_ansi16_code(rgb):
+        r, g, b = rgb
+        return _nearest_ansi16_jit(r, g, b, _ANSI16_RGB, _ANSI16_FG, _ANSI16_BG)
+
+# Coarse 32x32x32 LUT of (fg_code, bg_code) pairs: 16-color output only has
+# 16 possible answers, so the palette scan is brute-forced once at import
+# and per-call becomes a single list index.
+_LUT16 = [nearest_ansi16_code((r*8, g*8, b*8))
+          for r in range(32) for g in range(32) for b in range(32)]
+
+def ansi16_codes(r,g,b):
+    return _LUT16[((r>>3)<<10)|((g>>3)<<5)|(b>>3)]
+
+@functools.lru_cache(maxsize=4096)
 def bg_color_block_16(r,g,b):
-    key=(r,g,b)
-    if key in _bg_cache16: return _bg_cache16[key]
-    _, bg_code = nearest_ansi16_code(key)
-    esc = f"\x1b[{bg_code}m \x1b[0m"
-    _bg_cache16[key] = esc
-    return esc
+    _, bg_code = ansi16_codes(r,g,b)
+    return f"\x1b[{bg_code}m \x1b[0m".encode("utf-8")
+@functools.lru_cache(maxsize=4096)
 def fg_on_bg_char_16(fg,bg,ch=" "):
-    key=(fg,bg,ch)
-    if key in _fg_cache16: return _fg_cache16[key]
-    fg_code,_ = nearest_ansi16_code(fg); _, bg_code = nearest_ansi16_code(bg)
-    esc = f"\x1b[{bg_code};{fg_code}m{ch}{RESET}"
-    _fg_cache16[key] = esc
-    return esc
+    fg_code,_ = ansi16_codes(*fg); _, bg_code = ansi16_codes(*bg)
+    return f"\x1b[{bg_code};{fg_code}m{ch}{RESET}".encode("utf-8")
+
+@functools.lru_cache(maxsize=256)
+def render_text_line(fg, bg, text):
+    """Render a whole text line as one SGR prefix + text + reset instead of
+    one escape-wrapped cell per character. Cached per (fg, bg, text)."""
+    if MODE == "truecolor":
+        fr,fgc,fb = fg; br,bgc,bb = bg
+        prefix = f"\x1b[48;2;{br};{bgc};{bb}m\x1b[38;2;{fr};{fgc};{fb}m"
+    elif MODE == "256":
+        prefix = f"\x1b[48;5;{ansi256_code(*bg)}m\x1b[38;5;{ansi256_code(*fg)}m"
+    else:
+        fg_code,_ = ansi16_codes(*fg); _, bg_code = ansi16_codes(*bg)
+        prefix = f"\x1b[{bg_code};{fg_code}m"
+    return prefix.encode("utf-8") + text.encode("utf-8") + RESET_B
 
 # select final functions
 if MODE == "truecolor":
@@ -234,12 +358,26 @@ PALETTE = {
 bg_rgb = parse_rgb_arg(args.bg) or (18,8,84)
 controls_fg = (245,245,245)
 
+# SoA sprite: contiguous uint8 color planes plus a bool opacity mask,
+# produced by the NumPy rasterization paths. The legacy representation
+# (list-of-lists of RGB tuples / None) is still accepted everywhere as the
+# no-NumPy fallback.
+SpriteArray = namedtuple("SpriteArray", ["r", "g", "b", "mask"])
+
+def sprite_shape(sprite):
+    """(height, width) of either sprite representation."""
+    if isinstance(sprite, SpriteArray):
+        return sprite.mask.shape
+    return (len(sprite), len(sprite[0]) if sprite else 0)
+
 # -----------------------
 # PNG loading + rasterization to terminal-cell sprite
 # -----------------------
+@functools.lru_cache(maxsize=8)
 def load_png_sprite(path, target_cells, bg_rgb, use_supersample=True, supersample=4):
     """
     Load PNG and convert to a sprite sized target_cells x target_cells.
+    Memoized: a resize back to a previously used cell size is free.
     Returns sprite as list-of-lists where each cell is either None (transparent) or an (r,g,b) tuple.
     - If PIL not available or load fails, returns None.
     - Uses PIL resize with LANCZOS which provides good antialiasing; respects alpha channel.
@@ -267,7 +405,7 @@ def load_png_sprite(path, target_cells, bg_rgb, use_supersample=True, supersampl
     scale = max(hr / im_w, hr / im_h)
     new_w = max(1, int(round(im_w * scale)))
     new_h = max(1, int(round(im_h * scale)))
-    im_resized = im.resize((new_w, new_h), resample=Image.LANCZOS)
+    im_resized = resize_rgba(im, new_w, new_h)
     # crop or pad to hr x hr centered
     if new_w != hr or new_h != hr:
         # create transparent canvas hr x hr, paste centered
@@ -280,6 +418,25 @@ def load_png_sprite(path, target_cells, bg_rgb, use_supersample=True, supersampl
         hr_img = im_resized
 
     # Now downsample by block averaging into cells x cells
+    if NUMPY_AVAILABLE:
+        # Vectorized path: one bulk read of the HR image, block-reduce the
+        # premultiplied color + alpha, then composite against bg in NumPy.
+        arr = np.asarray(hr_img, dtype=np.float32)  # (hr, hr, 4)
+        a = arr[..., 3:4] / 255.0
+        rgb_pm = arr[..., :3] * a
+        rgb_avg = rgb_pm.reshape(cells, ss, cells, ss, 3).mean(axis=(1, 3))
+        a_avg = a.reshape(cells, ss, cells, ss, 1).mean(axis=(1, 3))
+        # un-premultiply (guard fully transparent blocks)
+        rgb = np.divide(rgb_avg, a_avg, out=np.zeros_like(rgb_avg), where=a_avg > 1e-6)
+        bg = np.asarray(bg_rgb, dtype=np.float32)
+        final = np.round(rgb * a_avg + bg * (1.0 - a_avg)).astype(np.uint8)
+        opaque = a_avg[..., 0] >= 0.01
+        return SpriteArray(r=np.ascontiguousarray(final[..., 0]),
+                           g=np.ascontiguousarray(final[..., 1]),
+                           b=np.ascontiguousarray(final[..., 2]),
+                           mask=opaque)
+
+    # Pure-Python fallback (no NumPy): per-pixel block averaging
     sprite = [[None for _ in range(cells)] for _ in range(cells)]
     hr_px = hr_img.load()
     for cy in range(cells):
@@ -325,14 +482,47 @@ def load_png_sprite(path, target_cells, bg_rgb, use_supersample=True, supersampl
 # -----------------------
 # Procedural fallback smooth circle (keeps older behavior)
 # -----------------------
+@functools.lru_cache(maxsize=8)
 def generate_smooth_circle(radius_cells, color_rgb, edge_rgb=None, supersample=4, edge_width=0.28):
     # uses previous supersampling algorithm (kept as fallback if PNG not used)
+    # memoized so bouncing between terminal sizes regenerates nothing
     cells = radius_cells * 2 + 1
     ss = max(1, int(supersample))
     high = cells * ss
     center = (high - 1) / 2.0
     rad_hr = radius_cells * ss
     edge_thickness_hr = max(1.0, edge_width * rad_hr)
+    if NUMPY_AVAILABLE:
+        # Vectorized path: distances, edge blend and the box downsample all
+        # as whole-array ops instead of the nested per-pixel loops.
+        yy, xx = np.mgrid[0:high, 0:high].astype(np.float32)
+        dist = np.hypot(xx - center, yy - center)
+        mask = dist <= rad_hr + 0.25 * ss
+        edge_start = max(0.0, (rad_hr - edge_thickness_hr) / (rad_hr + 1e-9))
+        if edge_rgb is None:
+            t_edge = np.zeros_like(dist)
+        elif (1.0 - edge_start) > 1e-6:
+            dn = dist / (rad_hr + 1e-9)
+            t_edge = np.clip((dn - edge_start) / (1.0 - edge_start), 0.0, 1.0)
+        else:
+            t_edge = (dist / (rad_hr + 1e-9) >= edge_start).astype(np.float32)
+        color = np.asarray(color_rgb, dtype=np.float32)
+        edge = np.asarray(edge_rgb if edge_rgb is not None else color_rgb, dtype=np.float32)
+        hr_rgb = color * (1.0 - t_edge[..., None]) + edge * t_edge[..., None]
+        # block-reduce: sum covered colors and coverage count per cell
+        col_sum = (hr_rgb * mask[..., None]).reshape(cells, ss, cells, ss, 3).sum(axis=(1, 3))
+        cnt = mask.reshape(cells, ss, cells, ss).sum(axis=(1, 3))[..., None].astype(np.float32)
+        avg = np.divide(col_sum, cnt, out=np.zeros_like(col_sum), where=cnt > 0)
+        cov = cnt / float(ss * ss)
+        bg = np.asarray(bg_rgb, dtype=np.float32)
+        final = np.round(avg * cov + bg * (1.0 - cov)).astype(np.uint8)
+        covered = cnt[..., 0] > 0
+        return SpriteArray(r=np.ascontiguousarray(final[..., 0]),
+                           g=np.ascontiguousarray(final[..., 1]),
+                           b=np.ascontiguousarray(final[..., 2]),
+                           mask=covered)
+
+    # Pure-Python fallback (no NumPy)
     hr_color = [None] * (high * high)
     for y in range(high):
         dy = y - center
@@ -384,42 +574,123 @@ def generate_smooth_circle(radius_cells, color_rgb, edge_rgb=None, supersample=4
 # -----------------------
 # Drawing helpers
 # -----------------------
-def place_sprite_on_canvas(canvas, sprite, top, left):
-    h = len(sprite); w = len(sprite[0]) if h else 0
+def compile_sprite_runs(sprite):
+    """Precompose a sprite into per-row runs of ready ANSI cell bytes.
+
+    Returns (h, w, [(sy, sx, [cell_bytes, ...]), ...]) covering only opaque
+    pixels, so per-frame placement is list slice assignment instead of
+    building a color escape for every pixel. The bounds let the placer pick
+    an unclipped fast path. Accepts both sprite representations.
+    """
+    h, w = sprite_shape(sprite)
+    runs = []
+    if isinstance(sprite, SpriteArray):
+        # SoA path: walk the contiguous mask/color planes row by row
+        rows_r = sprite.r.tolist(); rows_g = sprite.g.tolist()
+        rows_b = sprite.b.tolist(); rows_m = sprite.mask.tolist()
+        for sy in range(h):
+            rr = rows_r[sy]; rg = rows_g[sy]; rb = rows_b[sy]; rm = rows_m[sy]
+            sx = 0
+            while sx < w:
+                if not rm[sx]:
+                    sx += 1
+                    continue
+                start = sx
+                cells = []
+                while sx < w and rm[sx]:
+                    cells.append(bg_color_block(rr[sx], rg[sx], rb[sx]))
+                    sx += 1
+                runs.append((sy, start, cells))
+        return (h, w, runs)
+    for sy, row in enumerate(sprite):
+        sx = 0
+        while sx < w:
+            if row[sx] is None:
+                sx += 1
+                continue
+            start = sx
+            cells = []
+            while sx < w and row[sx] is not None:
+                cells.append(bg_color_block(*row[sx]))
+                sx += 1
+            runs.append((sy, start, cells))
+    return (h, w, runs)
+
+def place_runs_on_canvas(canvas, sprite_runs, top, left, dirty):
+    h, w, runs = sprite_runs
     sh = len(canvas); sw = len(canvas[0]) if sh else 0
-    for sy in range(h):
+    if 0 <= top and top + h <= sh and 0 <= left and left + w <= sw:
+        # fast path: sprite fully on-screen (always true for the centered
+        # planet), so no per-run clipping tests
+        for sy, sx, cells in runs:
+            cy = top + sy
+            x0 = left + sx
+            x1 = x0 + len(cells)
+            canvas[cy][x0:x1] = cells
+            dirty.extend((cy, x) for x in range(x0, x1))
+        return
+    for sy, sx, cells in runs:
         cy = top + sy
         if cy < 0 or cy >= sh: continue
-        for sx in range(w):
-            cx = left + sx
-            if cx < 0 or cx >= sw: continue
-            pixel = sprite[sy][sx]
-            if pixel is None: continue
-            r,g,b = pixel
-            canvas[cy][cx] = bg_color_block(r,g,b)
+        x0 = left + sx
+        x1 = x0 + len(cells)
+        if x1 <= 0 or x0 >= sw: continue
+        cs = cells
+        if x0 < 0:
+            cs = cs[-x0:]; x0 = 0
+        if x1 > sw:
+            cs = cs[:sw - x1]; x1 = sw
+        canvas[cy][x0:x1] = cs
+        dirty.extend((cy, x) for x in range(x0, x1))
+
+def diff_frame(canvas, prev):
+    """Damage-rect pass: compare against the shadow canvas, update it, and
+    return the escape bytes needed to bring the terminal up to date.
+
+    This is the per-frame hot path; it is kept as one self-contained
+    function over plain list rows so all loop state lives in fast locals,
+    and so a compiled implementation could replace just this seam if the
+    pure-Python version ever becomes the bottleneck.
+    """
+    buf = bytearray()
+    for y, crow in enumerate(canvas):
+        prow = prev[y]
+        last_x = -2
+        for x, cell in enumerate(crow):
+            if cell != prow[x]:
+                if x != last_x + 1:
+                    buf += f"\x1b[{y+1};{x+1}H".encode("ascii")
+                buf += cell
+                prow[x] = cell
+                last_x = x
+    return buf
 
 # -----------------------
 # Input smoothing / key-hold
 # -----------------------
-last_key_times = {}
-def read_key_nonblocking_record():
-    dr,_,_ = select.select([sys.stdin], [], [], 0)
-    if dr:
-        try:
-            c = sys.stdin.read(1)
-            if not c:
-                return None
-            t = time.time()
-            kc = c.lower()
-            if kc in ("w","a","s","d","q","i"):
-                last_key_times[kc] = t
-            return c
-        except (IOError, OSError):
-            return None
-    return None
-
-def key_recent(k):
-    return last_key_times.get(k, 0) >= time.time() - HOLD_TIMEOUT
+# fixed slots instead of a dict: checking a held key is a C array deref on
+# a constant index rather than string hashing ('q' = signed 64-bit, since
+# the timestamps are monotonic_ns integers)
+KEY_W, KEY_A, KEY_S, KEY_D, KEY_Q, KEY_I = range(6)
+KEY_IDX = {"w": KEY_W, "a": KEY_A, "s": KEY_S, "d": KEY_D, "q": KEY_Q, "i": KEY_I}
+last_key_times = array.array("q", [0] * 6)
+
+def read_key_recorded():
+    """Read one pending key (stdin already reported readable by the
+    selector) and record its press time for held-key simulation."""
+    try:
+        c = sys.stdin.read(1)
+    except (IOError, OSError):
+        return None
+    if not c:
+        return None
+    idx = KEY_IDX.get(c.lower())
+    if idx is not None:
+        last_key_times[idx] = time.monotonic_ns()
+    return c
+
+def key_recent(idx):
+    return last_key_times[idx] >= time.monotonic_ns() - HOLD_TIMEOUT_NS
 
 # -----------------------
 # Main simulation
@@ -451,40 +722,40 @@ def main():
         else:
             sat_radius = 1 if min(sh, sw) < 40 else 2
 
-        # Try to load PNG sprites if paths provided and PIL available
-        use_png_planet = False
-        use_png_sat = True
-        planet_sprite = None
-        sat_frames = None
-
-        if args.planet_png and PIL_AVAILABLE and os.path.isfile(args.planet_png):
-            ps = load_png_sprite(args.planet_png, planet_radius_cells * 2 + 1, bg_rgb,
-                                 use_supersample=True, supersample=SMOOTH_LEVEL)
-            if ps is not None:
-                planet_sprite = ps
-                use_png_planet = True
-
-        if args.sat_png and PIL_AVAILABLE and os.path.isfile(args.sat_png):
-            ssprite = load_png_sprite(args.sat_png, sat_radius * 2 + 1, bg_rgb,
-                                      use_supersample=True, supersample=max(1,SMOOTH_LEVEL))
-            if ssprite is not None:
-                sat_frames = [ssprite, ssprite]  # single frame used for both idle/firing unless multiple PNGs provided
-                use_png_sat = True
-
-        # If no PNGs or failed load, fall back to procedural smoothed sprites
-        if planet_sprite is None:
-            planet_sprite = generate_smooth_circle(planet_radius_cells, PALETTE["planet"],
-                                                   PALETTE["planet_edge"], supersample=SMOOTH_LEVEL,
-                                                   edge_width=0.28)
-        if sat_frames is None:
-            sat_frames = []
-            sat_frames.append(generate_smooth_circle(sat_radius, PALETTE["sat"], PALETTE["sat_edge"],
-                                                     supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
-            brighter = tuple(min(255, int(c+48)) for c in PALETTE["sat"])
-            sat_frames.append(generate_smooth_circle(sat_radius, brighter, PALETTE["sat_edge"],
-                                                     supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
-
-        sat_h = len(sat_frames[0]); sat_w = len(sat_frames[0][0])
+        # PNG decode + resample is the slow part of startup, so always begin
+        # with the cheap procedural sprites and let a worker thread deliver
+        # the PNG versions (Pillow releases the GIL while resampling); they
+        # are swapped in by the frame loop when ready.
+        png_executor = ThreadPoolExecutor(max_workers=1)
+        planet_fut = None
+        sat_fut = None
+        use_png_planet = bool(args.planet_png and PIL_AVAILABLE and os.path.isfile(args.planet_png))
+        use_png_sat = bool(args.sat_png and PIL_AVAILABLE and os.path.isfile(args.sat_png))
+
+        planet_sprite = generate_smooth_circle(planet_radius_cells, PALETTE["planet"],
+                                               PALETTE["planet_edge"], supersample=SMOOTH_LEVEL,
+                                               edge_width=0.28)
+        sat_frames = []
+        sat_frames.append(generate_smooth_circle(sat_radius, PALETTE["sat"], PALETTE["sat_edge"],
+                                                 supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
+        brighter = tuple(min(255, int(c+48)) for c in PALETTE["sat"])
+        sat_frames.append(generate_smooth_circle(sat_radius, brighter, PALETTE["sat_edge"],
+                                                 supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
+
+        if use_png_planet:
+            planet_fut = png_executor.submit(load_png_sprite, args.planet_png,
+                                             planet_radius_cells * 2 + 1, bg_rgb,
+                                             True, SMOOTH_LEVEL)
+        if use_png_sat:
+            sat_fut = png_executor.submit(load_png_sprite, args.sat_png,
+                                          sat_radius * 2 + 1, bg_rgb,
+                                          True, max(1,SMOOTH_LEVEL))
+
+        sat_h, sat_w = sprite_shape(sat_frames[0])
+
+        # precompose sprites into ready cell-byte runs
+        planet_runs = compile_sprite_runs(planet_sprite)
+        sat_runs = [compile_sprite_runs(f) for f in sat_frames]
 
         # cache bg cell
         bg_cell = bg_color_block(*bg_rgb)
@@ -496,69 +767,119 @@ def main():
         except Exception:
             pass
 
-        last_frame_time = time.time()
+        last_frame_time = time.monotonic_ns()
         fps_smooth = 0.0
+        prev = None  # last-emitted canvas; None forces a full redraw
+
+        # one selector handles both input polling and frame pacing
+        sel = selectors.DefaultSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ)
+        pending_keys = []
+
+        # persistent canvas: allocated once, cells written last frame are
+        # tracked in `dirty` and reset to background instead of rebuilding
+        # the whole list-of-lists every frame
+        canvas = [[bg_cell] * sw for _ in range(sh)]
+        dirty = []
 
         while True:
-            frame_start = time.time()
+            frame_start = time.monotonic_ns()
+
+            # swap in PNG sprites when a background load completes
+            if planet_fut is not None and planet_fut.done():
+                tmp = planet_fut.result()
+                planet_fut = None
+                if tmp is not None:
+                    planet_sprite = tmp
+                    planet_runs = compile_sprite_runs(planet_sprite)
+            if sat_fut is not None and sat_fut.done():
+                tmp = sat_fut.result()
+                sat_fut = None
+                if tmp is not None:
+                    sat_frames = [tmp, tmp]  # single frame for idle/firing
+                    sat_h, sat_w = sprite_shape(sat_frames[0])
+                    sat_runs = [compile_sprite_runs(f) for f in sat_frames]
+
             if resized:
                 sh, sw = get_term_size()
                 y0, x0 = sh//2, sw//2
                 x1 = x1 % sw; y1 = y1 % sh
+                new_planet_r = planet_radius_cells
+                new_sat_r = sat_radius
                 if not args.planet_size:
-                    planet_radius_cells = max(3, min(12, min(sh, sw)//8))
+                    new_planet_r = max(3, min(12, min(sh, sw)//8))
                 if not args.sat_size:
-                    sat_radius = 1 if min(sh, sw) < 40 else 2
-                # reload sprites if PNGs used, to adapt to new sizes
-                if use_png_planet and args.planet_png and os.path.isfile(args.planet_png) and PIL_AVAILABLE:
-                    tmp = load_png_sprite(args.planet_png, planet_radius_cells * 2 + 1, bg_rgb,
-                                          use_supersample=True, supersample=SMOOTH_LEVEL)
-                    if tmp is not None:
-                        planet_sprite = tmp
-                else:
-                    planet_sprite = generate_smooth_circle(planet_radius_cells, PALETTE["planet"],
-                                                           PALETTE["planet_edge"], supersample=SMOOTH_LEVEL,
-                                                           edge_width=0.28)
-                if use_png_sat and args.sat_png and os.path.isfile(args.sat_png) and PIL_AVAILABLE:
-                    tmp = load_png_sprite(args.sat_png, sat_radius * 2 + 1, bg_rgb,
-                                          use_supersample=True, supersample=max(1,SMOOTH_LEVEL))
-                    if tmp is not None:
-                        sat_frames = [tmp,tmp]
-                else:
-                    sat_frames = []
-                    sat_frames.append(generate_smooth_circle(sat_radius, PALETTE["sat"], PALETTE["sat_edge"],
-                                                             supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
-                    brighter = tuple(min(255, int(c+48)) for c in PALETTE["sat"])
-                    sat_frames.append(generate_smooth_circle(sat_radius, brighter, PALETTE["sat_edge"],
-                                                             supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
-                sat_h = len(sat_frames[0]); sat_w = len(sat_frames[0][0])
+                    new_sat_r = 1 if min(sh, sw) < 40 else 2
+                # reload sprites only when the cell size actually changed;
+                # most resize events leave the radii alone and the reload
+                # is the expensive part of handling SIGWINCH
+                if new_planet_r != planet_radius_cells:
+                    planet_radius_cells = new_planet_r
+                    if use_png_planet and os.path.isfile(args.planet_png):
+                        # reload off-thread; the old sprite keeps drawing
+                        # until the new one arrives
+                        planet_fut = png_executor.submit(load_png_sprite, args.planet_png,
+                                                         planet_radius_cells * 2 + 1, bg_rgb,
+                                                         True, SMOOTH_LEVEL)
+                    else:
+                        planet_sprite = generate_smooth_circle(planet_radius_cells, PALETTE["planet"],
+                                                               PALETTE["planet_edge"], supersample=SMOOTH_LEVEL,
+                                                               edge_width=0.28)
+                        planet_runs = compile_sprite_runs(planet_sprite)
+                if new_sat_r != sat_radius:
+                    sat_radius = new_sat_r
+                    if use_png_sat and os.path.isfile(args.sat_png):
+                        sat_fut = png_executor.submit(load_png_sprite, args.sat_png,
+                                                      sat_radius * 2 + 1, bg_rgb,
+                                                      True, max(1,SMOOTH_LEVEL))
+                    else:
+                        sat_frames = []
+                        sat_frames.append(generate_smooth_circle(sat_radius, PALETTE["sat"], PALETTE["sat_edge"],
+                                                                 supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
+                        brighter = tuple(min(255, int(c+48)) for c in PALETTE["sat"])
+                        sat_frames.append(generate_smooth_circle(sat_radius, brighter, PALETTE["sat_edge"],
+                                                                 supersample=max(1,SMOOTH_LEVEL), edge_width=0.35))
+                        sat_h, sat_w = sprite_shape(sat_frames[0])
+                        sat_runs = [compile_sprite_runs(f) for f in sat_frames]
+                canvas = [[bg_cell] * sw for _ in range(sh)]
+                del dirty[:]
+                prev = None  # terminal geometry changed: force full redraw
                 resized = False
 
-            # Input
-            key = read_key_nonblocking_record()
-            if key:
+            # Input: keys collected during the pacing wait plus any pending
+            keys = pending_keys
+            pending_keys = []
+            while sel.select(0):
+                k = read_key_recorded()
+                if k is None:
+                    break
+                keys.append(k)
+            quit_requested = False
+            for key in keys:
                 k = key.lower()
                 if k == "q":
-                    break
-                if k == "i":
+                    quit_requested = True
+                elif k == "i":
                     debug = not debug
+            if quit_requested:
+                break
 
             # thrust via recent key timestamps (simulated hold)
             thrusting = False
-            if key_recent("w"):
+            if key_recent(KEY_W):
                 vy1 -= TH; thrusting = True
-            if key_recent("s"):
+            if key_recent(KEY_S):
                 vy1 += TH; thrusting = True
-            if key_recent("a"):
+            if key_recent(KEY_A):
                 vx1 -= TH; thrusting = True
-            if key_recent("d"):
+            if key_recent(KEY_D):
                 vx1 += TH; thrusting = True
 
-            # gravity towards planet center
-            if x1 < x0: vx1 += AC
-            else: vx1 -= AC
-            if y1 < y0: vy1 += AC
-            else: vy1 -= AC
+            # gravity towards planet center (branchless: the satellite
+            # crosses the center axes constantly, so the old if/else pair
+            # was a mispredicted branch per axis per frame)
+            vx1 -= math.copysign(AC, x1 - x0)
+            vy1 -= math.copysign(AC, y1 - y0)
 
             # integrate
             x1 += vx1; y1 += vy1
@@ -568,9 +889,11 @@ def main():
             if sh <= 0: sh = 1
             x1 = x1 % sw; y1 = y1 % sh
 
-            # build canvas filled with bg
-            bg_cell = bg_color_block(*bg_rgb)
-            canvas = [[bg_cell for _ in range(sw)] for _ in range(sh)]
+            # reset cells written last frame back to background
+            # (bg_cell is constant between SIGWINCH events; computed at init)
+            for dy, dx in dirty:
+                canvas[dy][dx] = bg_cell
+            del dirty[:]
 
             # controls line
             controls = "W A S D: THRUST | Q: QUIT | I: TOGGLE HUD"
@@ -578,29 +901,29 @@ def main():
                 controls = controls[:sw]
             for i,ch in enumerate(controls):
                 canvas[-1][i] = fg_on_bg_char(controls_fg, bg_rgb, ch)
+                dirty.append((sh - 1, i))
 
             # draw planet (center)
-            pr = len(planet_sprite)
+            pr, _ = sprite_shape(planet_sprite)
             top = int(round(y0)) - pr//2
             left = int(round(x0)) - pr//2
-            place_sprite_on_canvas(canvas, planet_sprite, top, left)
+            place_runs_on_canvas(canvas, planet_runs, top, left, dirty)
 
             # draw satellite
             frame_index = 1 if thrusting else 0
-            if thrusting and (time.time()*12) % 2 > 1:
+            if thrusting and (frame_start * 12 // 1_000_000_000) % 2 == 1:
                 frame_index = 0
-            sat_sprite = sat_frames[frame_index]
             top = int(round(y1)) - sat_h//2
             left = int(round(x1)) - sat_w//2
-            place_sprite_on_canvas(canvas, sat_sprite, top, left)
+            place_runs_on_canvas(canvas, sat_runs[frame_index], top, left, dirty)
 
             # HUD
             if debug:
-                now = time.time()
-                dt = now - last_frame_time if last_frame_time else 0.0
+                now = time.monotonic_ns()
+                dt_ns = now - last_frame_time
                 last_frame_time = now
-                if dt > 0:
-                    fps = 1.0 / dt
+                if dt_ns > 0:
+                    fps = 1e9 / dt_ns
                     fps_smooth = fps_smooth * 0.85 + fps * 0.15 if 'fps_smooth' in locals() else fps
                 else:
                     fps = 0.0
@@ -611,23 +934,52 @@ def main():
                     f"PIL: {'yes' if PIL_AVAILABLE else 'no'}  PNG_planet: {'yes' if use_png_planet else 'no'}  PNG_sat: {'yes' if use_png_sat else 'no'}"
                 ]
                 hud_fg = (245,245,245)
+                hud_parts = []
+                hud_spans = []  # (row, length) of cells overdrawn on screen
                 for hi, line in enumerate(hud_lines):
                     if hi >= sh-2: break
-                    for ci, ch in enumerate(line):
-                        if ci >= sw: break
-                        canvas[hi][ci] = fg_on_bg_char(hud_fg, bg_rgb, ch)
-
-            # output in single write
-            out = CURSOR_HOME + "\n".join("".join(r) for r in canvas)
-            os.write(1, out.encode("utf-8"))
-
-            # frame pacing
-            elapsed = time.time() - frame_start
-            to_sleep = FRAME_MS/1000.0 - elapsed
-            if to_sleep > 0:
-                time.sleep(to_sleep)
+                    line = line[:sw]
+                    hud_parts.append(f"\x1b[{hi+1};1H".encode("ascii")
+                                     + render_text_line(hud_fg, bg_rgb, line))
+                    hud_spans.append((hi, len(line)))
+                hud_buf = b"".join(hud_parts)
+            else:
+                hud_buf = b""
+                hud_spans = []
+
+            # damage-rect output: emit only cells that changed since last
+            # frame. Most frames only touch O(satellite area + HUD) cells.
+            if prev is None:
+                prev = [[None] * sw for _ in range(sh)]
+            buf = diff_frame(canvas, prev)
+            # HUD lines overdraw the canvas directly; invalidate the shadow
+            # cells underneath so the area repaints when the HUD moves or
+            # is toggled off
+            for hi, n in hud_spans:
+                prow = prev[hi]
+                for ci in range(n):
+                    prow[ci] = None
+            if buf or hud_buf:
+                os.write(1, buf + hud_buf)
+
+            # frame pacing: sleep inside the selector so a keystroke wakes
+            # us immediately -- one poll syscall per frame instead of
+            # select() + nanosleep()
+            deadline = frame_start + FRAME_NS
+            while True:
+                remaining = deadline - time.monotonic_ns()
+                if remaining <= 0:
+                    break
+                if sel.select(remaining / 1e9):
+                    k = read_key_recorded()
+                    if k is not None:
+                        pending_keys.append(k)
 
     finally:
+        try:
+            png_executor.shutdown(wait=False)
+        except NameError:
+            pass
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         sh, sw = get_term_size()
         os.write(1, (CSI + f"{sh};1H" + SHOW_CURSOR + RESET + "\n").encode())
@@ -27,11 +27,18 @@ import sys
 import time
 import tty
 import termios
-import select
 import signal
 import shutil
 import math
 
+# NumPy is optional: it vectorizes sprite generation when installed, and the
+# pure-Python paths are kept so the script still needs no external libs.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
 # ANSI helpers
 CSI = "\x1b["
 HIDE_CURSOR = CSI + "?25l"
@@ -39,6 +46,7 @@ SHOW_CURSOR = CSI + "?25h"
 CLEAR_SCREEN = CSI + "2J"
 CURSOR_HOME = CSI + "H"
 RESET = CSI + "0m"
+RESET_B = RESET.encode("ascii")  # bytes twin for the frame hot path
 
 FRAME_MS = 50  # 50 ms -> ~20 FPS
 
@@ -55,16 +63,15 @@ def get_term_size():
     return ts.lines, ts.columns
 
 
-def read_key_nonblocking():
-    # returns a single character string or None
-    dr, _, _ = select.select([sys.stdin], [], [], 0)
-    if dr:
-        try:
-            c = sys.stdin.read(1)
-            return c
-        except (IOError, OSError):
-            return None
-    return None
+def read_key_nonblocking(fd):
+    # returns whatever is pending (possibly a multi-byte escape) or None.
+    # Relies on VMIN=0/VTIME=0 set in main: os.read returns immediately
+    # with b"" when no key is pending, so no select() poll is needed.
+    try:
+        data = os.read(fd, 8)
+    except (BlockingIOError, OSError):
+        return None
+    return data.decode(errors="ignore") or None
 
 
 # -----------------------
@@ -82,6 +89,26 @@ def fg_color_char(r, g, b, ch="█"):
     return f"\x1b[38;2;{r};{g};{b}m{ch}{RESET}"
 
 
+CELL_CACHE = {}
+
+
+def cell(rgb):
+    """Memoized (sgr_prefix, char) bytes cell for an RGB background block.
+
+    Sprites store these ready-made byte pairs instead of RGB tuples, so no
+    formatting happens per painted pixel per frame (mirrors the COLOR_MAP
+    pattern in simTWO.py). Keeping the SGR separate from the char lets the
+    renderer set the color once per run instead of set+reset per cell, and
+    bytes from the start means no str->utf-8 encode pass when the frame is
+    written out.
+    """
+    s = CELL_CACHE.get(rgb)
+    if s is None:
+        s = (b"\x1b[48;2;%d;%d;%dm" % tuple(rgb), b" ")
+        CELL_CACHE[rgb] = s
+    return s
+
+
 def clamp(v, a=0, b=255):
     return max(a, min(b, int(v)))
 
@@ -91,6 +118,31 @@ def blend(c1, c2, t):
     return tuple(clamp(c1[i] * (1 - t) + c2[i] * t) for i in range(3))
 
 
+class Sprite:
+    """Structure-of-arrays pixel store: parallel R/G/B byte planes plus an
+    opacity mask, all flat row-major bytearrays.
+
+    One pixel costs four bytes in four contiguous buffers instead of a
+    Python tuple of three ints inside nested lists, so generation and
+    bar-compilation walk plain memory.
+    """
+    __slots__ = ("h", "w", "r", "g", "b", "mask")
+
+    def __init__(self, h, w):
+        self.h = h
+        self.w = w
+        n = h * w
+        self.r = bytearray(n)
+        self.g = bytearray(n)
+        self.b = bytearray(n)
+        self.mask = bytearray(n)
+
+    def set(self, y, x, rgb):
+        i = y * self.w + x
+        self.r[i], self.g[i], self.b[i] = rgb
+        self.mask[i] = 1
+
+
 # Metal Gear-ish palette (muted greens, olive, gray, metal)
 PALETTE = {
     "olive": (96, 106, 41),
@@ -105,36 +157,69 @@ PALETTE = {
 }
 
 
+# LUTs for the scalar shading fallback below: sqrt over the small integer
+# dx*dx+dy*dy domain (radius <= 12 in practice) and the base->shadow ramp
+# indexed by int(t*256), so the per-pixel work is integer indexing instead
+# of math.sqrt plus two three-float blends
+SQRT_LUT = [math.sqrt(i) for i in range(2 * 12 * 12 + 1)]
+_SHADE_BASE = blend(PALETTE["olive"], PALETTE["metal"], 0.35)
+SHADE_LUT = [blend(_SHADE_BASE, PALETTE["shadow"], (i / 256.0) * 0.7)
+             for i in range(257)]
+
+
 def generate_planet_sprite(radius):
-    """Generate a simple shaded circular planet sprite (2D array of RGB or None)."""
+    """Generate a shaded circular planet Sprite (SoA pixel planes + mask)."""
     size = radius * 2 + 1
     cx = cy = radius
-    sprite = [[None for _ in range(size)] for _ in range(size)]
+    if NUMPY_AVAILABLE:
+        # whole-array version of the per-pixel math below; the only Python
+        # loop left is interning the cell strings
+        yy, xx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+        dist = np.sqrt(xx * xx + yy * yy)
+        mask = dist <= radius + 0.25
+        t = dist / (radius + 0.01)
+        base = np.array(blend(PALETTE["olive"], PALETTE["metal"], 0.35), dtype=np.float64)
+        shadow = np.array(PALETTE["shadow"], dtype=np.float64)
+        highlight = np.array(PALETTE["highlight"], dtype=np.float64)
+        tt = np.clip(t * 0.7, 0.0, 1.0)[..., None]
+        shade = base * (1 - tt) + shadow * tt
+        light = 0.25 * (1 - ((xx - radius * 0.3) ** 2 + (yy + radius * 0.3) ** 2) / (radius * radius + 1))
+        light = np.maximum(0.0, light)[..., None]
+        final = np.clip(shade * (1 - light) + highlight * light, 0, 255).astype(np.uint8)
+        sp = Sprite(size, size)
+        sp.r[:] = final[:, :, 0].tobytes()
+        sp.g[:] = final[:, :, 1].tobytes()
+        sp.b[:] = final[:, :, 2].tobytes()
+        sp.mask[:] = mask.astype(np.uint8).tobytes()
+        return sp
+    sprite = Sprite(size, size)
+    limit2 = (radius + 0.25) ** 2
+    inv_r = 256.0 / (radius + 0.01)
+    lut_len = len(SQRT_LUT)
     for y in range(size):
+        dy = y - cy
         for x in range(size):
             dx = x - cx
-            dy = y - cy
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist <= radius + 0.25:
-                # shading based on angle / distance
-                t = dist / (radius + 0.01)  # 0..1 (edge)
-                # hue between olive and metal for a "camouflage/tech" look
-                base = blend(PALETTE["olive"], PALETTE["metal"], 0.35)
-                shade = blend(base, PALETTE["shadow"], t * 0.7)
-                # rim highlight on upper-left to simulate light
-                light = 0.25 * (1 - ((dx - radius * 0.3) ** 2 + (dy + radius * 0.3) ** 2) / (radius * radius + 1))
-                light = max(0.0, light)
-                final = blend(shade, PALETTE["highlight"], light)
-                sprite[y][x] = tuple(int(c) for c in final)
-            else:
-                sprite[y][x] = None
+            d2 = dx * dx + dy * dy
+            if d2 > limit2:
+                continue
+            # shading based on distance: olive/metal base darkened toward
+            # the rim, entirely via the precomputed LUTs
+            dist = SQRT_LUT[d2] if d2 < lut_len else math.sqrt(d2)
+            t_idx = int(dist * inv_r)
+            shade = SHADE_LUT[t_idx if t_idx < 256 else 256]
+            # rim highlight on upper-left to simulate light
+            light = 0.25 * (1 - ((dx - radius * 0.3) ** 2 + (dy + radius * 0.3) ** 2) / (radius * radius + 1))
+            if light > 0.0:
+                shade = blend(shade, PALETTE["highlight"], light)
+            sprite.set(y, x, shade)
     return sprite
 
 
 def generate_satellite_frames():
     """
     Generate two small frames for the "satellite" (soldier/robot) sprite.
-    Each frame is a list-of-lists of RGB or None (transparent).
+    Each frame is a Sprite (SoA pixel planes + transparency mask).
     Size chosen small so terminal cells represent pixels.
     """
     frames = []
@@ -163,8 +248,14 @@ def generate_satellite_frames():
         [PALETTE["dark_olive"], None, PALETTE["thruster1"], None, PALETTE["dark_olive"]],
     ]
 
-    frames.append(idle)
-    frames.append(thrust)
+    # pack the tuple art into SoA planes once at generation time
+    for frame in (idle, thrust):
+        sp = Sprite(len(frame), len(frame[0]))
+        for y, row in enumerate(frame):
+            for x, p in enumerate(row):
+                if p is not None:
+                    sp.set(y, x, p)
+        frames.append(sp)
     return frames
 
 
@@ -172,29 +263,205 @@ def generate_satellite_frames():
 # Drawing helpers
 # -----------------------
 
-def place_sprite_on_canvas(canvas, sprite, top, left):
+def place_bars_on_canvas(canvas, bars, top, left, sh, sw):
+    """Write precompiled bars into the flat canvas, one clipped slice
+    assignment per run instead of one bounds check + store per pixel."""
+    for sy, sx, sgr, text in bars:
+        cy = top + sy
+        if not 0 <= cy < sh:
+            continue
+        cx = left + sx
+        start = 0
+        if cx < 0:
+            start = -cx
+            cx = 0
+        end = len(text)
+        if cx + (end - start) > sw:
+            end = start + (sw - cx)
+        if end <= start:
+            continue
+        rowbase = cy * sw
+        canvas[rowbase + cx:rowbase + cx + (end - start)] = [
+            (sgr, text[i:i + 1]) for i in range(start, end)]
+
+
+def compile_bars(sprite):
+    """Compile a Sprite into horizontal bars: [(sy, sx, sgr, text), ...].
+
+    Adjacent opaque pixels sharing a color merge into one bar, so a sprite
+    row goes out as one cursor jump + one SGR + the run chars + one reset
+    instead of per-pixel escape sequences. Walks the flat SoA planes by
+    index; no nested-list or tuple traffic.
+    """
+    bars = []
+    rp, gp, bp, mask = sprite.r, sprite.g, sprite.b, sprite.mask
+    w = sprite.w
+    for sy in range(sprite.h):
+        base = sy * w
+        x = 0
+        while x < w:
+            i = base + x
+            if not mask[i]:
+                x += 1
+                continue
+            rgb = (rp[i], gp[i], bp[i])
+            sgr, ch = cell(rgb)
+            start = x
+            text = ch
+            x += 1
+            i += 1
+            while x < w and mask[i] and (rp[i], gp[i], bp[i]) == rgb:
+                text += ch
+                x += 1
+                i += 1
+            bars.append((sy, start, sgr, text))
+    return bars
+
+
+def build_cup_tables(sh, sw):
+    """Pre-encoded cursor-position fragments for the current geometry.
+
+    ROW_CUP[r] + COL_H[c] == b"\\x1b[<r+1>;<c+1>H", so the hot emitters do
+    one bytes concatenation per jump instead of formatting the escape.
+    Rebuilt on resize.
+    """
+    return ([b"\x1b[%d;" % (r + 1) for r in range(sh)],
+            [b"%dH" % (c + 1) for c in range(sw)])
+
+
+# sentinel for "cell contents unknown" in the NumPy prev array (the list
+# renderer uses None for the same purpose)
+PREV_UNKNOWN = 0xFFFF
+
+
+def index_canvas(cv):
+    """Mirror a flat cell-tuple canvas as a uint16 palette-index array.
+
+    Returns (idx_array, palette) where palette[idx_array[i]] == cv[i].
+    uint16 because the planet's per-pixel shades alone can exceed 256
+    distinct cells. Built once per geometry; the per-frame diff then
+    compares indices at C speed instead of tuples in a Python loop.
+    Also returns the cell->index dict so sprites can intern their colors
+    into the same palette.
     """
-    canvas: 2D list of cell strings (already with ANSI if colored)
-    sprite: 2D list of RGB triples or None
-    top,left: where sprite[0][0] maps to canvas[top][left]
+    index = {}
+    palette = []
+    idx = np.empty(len(cv), np.uint16)
+    for i, cellv in enumerate(cv):
+        j = index.get(cellv)
+        if j is None:
+            j = index[cellv] = len(palette)
+            palette.append(cellv)
+        idx[i] = j
+    return idx, palette, index
+
+
+def sprite_index_planes(sprite, index, palette):
+    """Palette-index and mask planes for a Sprite, for the njit compose.
+
+    Interns any sprite colors the palette does not already contain, so the
+    composed frame and the canvas share one palette.
     """
-    h = len(sprite)
-    w = len(sprite[0]) if h else 0
-    sh = len(canvas)
-    sw = len(canvas[0]) if sh else 0
-    for sy in range(h):
+    n = sprite.h * sprite.w
+    idx = np.zeros(n, np.uint16)
+    for i in range(n):
+        if sprite.mask[i]:
+            cv = cell((sprite.r[i], sprite.g[i], sprite.b[i]))
+            j = index.get(cv)
+            if j is None:
+                j = index[cv] = len(palette)
+                palette.append(cv)
+            idx[i] = j
+    return idx, np.frombuffer(bytes(sprite.mask), np.uint8)
+
+
+def emit_sprite(out, prev, bars, top, left, sh, sw, row_cup, col_h, blank=None):
+    """Append each on-screen bar to `out` as CUP + SGR + run + reset,
+    bypassing the canvas, and blank the covered `prev` cells (to `blank`)
+    so the diff pass repaints the area (erasing the sprite) on the next
+    frame."""
+    for sy, sx, sgr, text in bars:
         cy = top + sy
+        if not 0 <= cy < sh:
+            continue
+        cx = left + sx
+        if cx < 0:
+            text = text[-cx:]
+            cx = 0
+        if cx + len(text) > sw:
+            text = text[:sw - cx]
+        if not text:
+            continue
+        out.append(row_cup[cy] + col_h[cx])
+        if sgr:
+            out.append(sgr)
+            out.append(text)
+            out.append(RESET_B)
+        else:
+            out.append(text)
+        rowbase = cy * sw
+        for i in range(cx, cx + len(text)):
+            prev[rowbase + i] = blank
+
+
+# -----------------------
+# Physics
+# -----------------------
+
+def step(x1, y1, vx1, vy1, x0, y0, sw, sh, AC, DE, thrust_dx, thrust_dy, TH):
+    """One physics tick: thrust, gravity toward (x0, y0), damping, wrap."""
+    vx1 += thrust_dx * TH
+    vy1 += thrust_dy * TH
+    vx1 += AC if x1 < x0 else -AC
+    vy1 += AC if y1 < y0 else -AC
+    x1 += vx1
+    y1 += vy1
+    vx1 *= DE
+    vy1 *= DE
+    # branch-based wrap instead of float modulo: the satellite moves well
+    # under a screen per tick, so one compare+add per axis is always enough
+    if x1 < 0:
+        x1 += sw
+    elif x1 >= sw:
+        x1 -= sw
+    if y1 < 0:
+        y1 += sh
+    elif y1 >= sh:
+        y1 -= sh
+    return x1, y1, vx1, vy1
+
+
+# Numba is optional: when present the per-frame float arithmetic and the
+# frame compose below run as native code instead of interpreted bytecode.
+# It is only usable together with numpy (the compose works on index arrays).
+try:
+    from numba import njit
+    step = njit(cache=True, fastmath=True)(step)
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except Exception:
+    NUMBA_AVAILABLE = False
+
+
+def compose_frame(base, frame, sidx, smask, h, w, top, left, sh, sw):
+    """Whole-frame compose on flat palette-index arrays: copy the static
+    canvas indices and blit the satellite's indices where its mask is set.
+    Pure-numeric loops, written to be njit-compiled (see below)."""
+    frame[:] = base
+    for y in range(h):
+        cy = top + y
         if cy < 0 or cy >= sh:
             continue
-        for sx in range(w):
-            cx = left + sx
-            if cx < 0 or cx >= sw:
-                continue
-            pixel = sprite[sy][sx]
-            if pixel is None:
-                continue
-            r, g, b = pixel
-            canvas[cy][cx] = bg_color_block(r, g, b)
+        rowbase = cy * sw
+        srow = y * w
+        for x in range(w):
+            if smask[srow + x]:
+                cx = left + x
+                if 0 <= cx < sw:
+                    frame[rowbase + cx] = sidx[srow + x]
+
+
+if NUMBA_AVAILABLE:
+    compose_frame = njit(cache=True)(compose_frame)
 
 
 # -----------------------
@@ -212,8 +479,14 @@ def main():
     AC, DE, TH = 0.05, 0.98, 0.4
 
     try:
-        # Put terminal in raw mode so we can read single keypresses
+        # Put terminal in raw mode so we can read single keypresses, and set
+        # VMIN=0/VTIME=0 so os.read() is non-blocking on its own -- one
+        # syscall per frame instead of select()+read()
         tty.setcbreak(fd)
+        attrs = termios.tcgetattr(fd)
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
 
         # Hide cursor, clear screen, move home
         os.write(1, (HIDE_CURSOR + CLEAR_SCREEN + CURSOR_HOME).encode())
@@ -224,23 +497,73 @@ def main():
         sh, sw = get_term_size()
         # initial planet center
         y0, x0 = sh // 2, sw // 2
-        # satellite initial position
-        y1, x1 = y0, x0 + 10
+        # satellite initial position (floats so the JIT'd step stays
+        # monomorphic)
+        y1, x1 = float(y0), float(x0 + 10)
         vy1, vx1 = 0.0, 0.0
 
+        # warm-up call so any JIT compilation cost lands here, not in the
+        # first frame's budget
+        step(0.0, 0.0, 0.0, 0.0, x0, y0, max(1, sw), max(1, sh), AC, DE, 0.0, 0.0, TH)
+
         # Pre-generate sprites
         planet_radius_cells = max(3, min(12, min(sh, sw) // 8))
         planet_sprite = generate_planet_sprite(planet_radius_cells)
+        planet_bars = compile_bars(planet_sprite)
         sat_frames = generate_satellite_frames()
-        sat_w = len(sat_frames[0][0])
-        sat_h = len(sat_frames[0])
+        sat_bars = [compile_bars(f) for f in sat_frames]
+        sat_w = sat_frames[0].w
+        sat_h = sat_frames[0].h
 
-        last_time = time.time()
         thrusting = False
         thrust_timer = 0.0
+        prev = None  # shadow of what is on screen; None forces full repaint
+        last_sig = None  # signature of the last rendered frame
+
+        # Absolute-deadline scheduler on the monotonic integer clock: no
+        # wall-clock jumps, no float subtraction drift, one clock read per
+        # frame for pacing
+        PERIOD_NS = FRAME_MS * 1_000_000
+        deadline = time.monotonic_ns()
+        frame_count = 0
+
+        # Everything on the canvas (background, controls, planet) is static
+        # between resizes, so it is built once per geometry and never touched
+        # in the frame loop: no per-frame clearing or repainting of the grid.
+        # The only moving thing -- the satellite -- bypasses it via
+        # emit_sprite above.
+        BG_CELL = (b"", b" ")
+
+        def build_canvas():
+            cv = [BG_CELL] * (sh * sw)
+            controls = "W-A-S-D: THRUST | Q: QUIT"
+            if len(controls) >= sw:
+                controls = controls[:sw]
+            base = (sh - 1) * sw
+            for i, ch in enumerate(controls):
+                cv[base + i] = (b"", ch.encode("ascii"))
+            # planet sprite centered at (y0, x0)
+            pr = planet_sprite.h
+            place_bars_on_canvas(cv, planet_bars,
+                                 int(y0) - pr // 2, int(x0) - pr // 2,
+                                 sh, sw)
+            return cv
+
+        canvas = build_canvas()
+        ROW_CUP, COL_H = build_cup_tables(sh, sw)
+        if NUMPY_AVAILABLE:
+            canvas_idx, cell_palette, cell_index = index_canvas(canvas)
+        if NUMBA_AVAILABLE:
+            # satellite as palette-index planes + a scratch frame for the
+            # njit compose; first call also triggers (cached) compilation
+            sat_planes = [sprite_index_planes(sp, cell_index, cell_palette)
+                          for sp in sat_frames]
+            frame_idx = np.empty_like(canvas_idx)
+            compose_frame(canvas_idx, frame_idx, sat_planes[0][0],
+                          sat_planes[0][1], sat_h, sat_w, 0, 0, sh, sw)
 
         while True:
-            frame_start = time.time()
+            frame_count += 1
             # handle resize
             if resized:
                 sh, sw = get_term_size()
@@ -251,97 +574,160 @@ def main():
                 # regenerate planet if terminal got much larger/smaller
                 planet_radius_cells = max(3, min(12, min(sh, sw) // 8))
                 planet_sprite = generate_planet_sprite(planet_radius_cells)
+                planet_bars = compile_bars(planet_sprite)
+                canvas = build_canvas()
+                ROW_CUP, COL_H = build_cup_tables(sh, sw)
+                if NUMPY_AVAILABLE:
+                    canvas_idx, cell_palette, cell_index = index_canvas(canvas)
+                if NUMBA_AVAILABLE:
+                    sat_planes = [sprite_index_planes(sp, cell_index,
+                                                      cell_palette)
+                                  for sp in sat_frames]
+                    frame_idx = np.empty_like(canvas_idx)
+                prev = None  # geometry changed: full repaint next frame
+                last_sig = None
                 resized = False
 
             # Input (non-blocking)
-            key = read_key_nonblocking()
+            key = read_key_nonblocking(fd)
             thrusting = False
+            thrust_dx = thrust_dy = 0.0
             if key:
                 k = key.lower()
+                if 'q' in k:
+                    break
+                # a single os.read can return several queued bytes (key
+                # repeat, escape sequences); act on the most recent one
+                k = k[-1]
                 if k == 'w':
-                    vy1 -= TH
+                    thrust_dy = -1.0
                     thrusting = True
                 elif k == 's':
-                    vy1 += TH
+                    thrust_dy = 1.0
                     thrusting = True
                 elif k == 'a':
-                    vx1 -= TH
+                    thrust_dx = -1.0
                     thrusting = True
                 elif k == 'd':
-                    vx1 += TH
+                    thrust_dx = 1.0
                     thrusting = True
-                elif k == 'q':
-                    break
                 # ignore other keys
 
-            # Gravity logic (same as original)
-            if x1 < x0:
-                vx1 += AC
-            else:
-                vx1 -= AC
-            if y1 < y0:
-                vy1 += AC
-            else:
-                vy1 -= AC
-
-            # Apply velocity and damping
-            x1 += vx1
-            y1 += vy1
-            vx1 *= DE
-            vy1 *= DE
-
-            # Wrap
+            # Physics tick (gravity, thrust, damping, wrap)
             if sw <= 0:
                 sw = 1
             if sh <= 0:
                 sh = 1
-            x1 = x1 % sw
-            y1 = y1 % sh
-
-            # Build canvas: 2D list of plain strings (one cell each)
-            canvas = [[" " for _ in range(sw)] for _ in range(sh)]
-
-            # Put controls on bottom row (overwrite)
-            controls = "W-A-S-D: THRUST | Q: QUIT"
-            if len(controls) >= sw:
-                controls = controls[:sw]
-            for i, ch in enumerate(controls):
-                canvas[-1][i] = ch
+            x1, y1, vx1, vy1 = step(x1, y1, vx1, vy1, x0, y0, sw, sh,
+                                    AC, DE, thrust_dx, thrust_dy, TH)
 
-            # Draw planet sprite centered at (y0, x0)
-            # planet_sprite has size pr x pr
-            pr = len(planet_sprite)
-            top = int(y0) - pr // 2
-            left = int(x0) - pr // 2
-            place_sprite_on_canvas(canvas, planet_sprite, top, left)
-
-            # Draw satellite sprite (choose frame)
+            # Choose satellite frame early so it can be part of the signature
             frame_index = 1 if thrusting else 0
-            # simple flicker animation if thrusting
-            if thrusting:
-                # alternate between frame 0 and 1 based on time for flicker
-                if (time.time() * 8) % 2 > 1:
-                    frame_index = 0
-            sat_sprite = sat_frames[frame_index]
-            # compute top-left to place so that sprite center is at (y1,x1)
-            top = int(y1) - sat_h // 2
-            left = int(x1) - sat_w // 2
-            place_sprite_on_canvas(canvas, sat_sprite, top, left)
-
-            # Join and write to terminal in a single write for best performance.
-            # Because cells may contain ANSI sequences, join each cell and append newline.
-            buf_lines = []
-            for row in canvas:
-                buf_lines.append("".join(row))
-            buf = CURSOR_HOME + "\n".join(buf_lines)
-            os.write(1, buf.encode("utf-8"))
-
-            # Frame pacing (keep ~FRAME_MS)
-            elapsed = (time.time() - frame_start)
-            to_sleep = FRAME_MS / 1000.0 - elapsed
-            if to_sleep > 0:
-                time.sleep(to_sleep)
-            # else: behind schedule, immediately continue
+            # simple flicker animation if thrusting: alternate frames on the
+            # frame counter instead of sampling the wall clock
+            if thrusting and frame_count & 1:
+                frame_index = 0
+
+            # If nothing visible moved (satellite still rounds to the same
+            # cell, same animation frame, same geometry) the frame would be
+            # byte-identical: skip the build and emit entirely
+            sig = (int(y1), int(x1), frame_index, sh, sw)
+            if sig == last_sig:
+                deadline += PERIOD_NS
+                sleep_ns = deadline - time.monotonic_ns()
+                if sleep_ns > 0:
+                    time.sleep(sleep_ns / 1e9)
+                else:
+                    deadline = time.monotonic_ns()  # behind schedule: resync
+                continue
+            last_sig = sig
+
+            # Satellite top-left so that sprite center is at (y1,x1); the
+            # sprite itself is emitted directly after the diff pass below
+            sat_top = int(y1) - sat_h // 2
+            sat_left = int(x1) - sat_w // 2
+
+            # Diff against the previously emitted canvas and write only the
+            # cells that changed, each prefixed by a cursor jump. Almost all
+            # cells are static background, so typical frames shrink from a
+            # full-screen repaint to the sprite/HUD area.
+            out = []
+            if NUMPY_AVAILABLE:
+                # C-level diff: compare palette indices and pull out only the
+                # changed flat positions, then emit those few cells
+                if prev is None:
+                    prev = np.full(sh * sw, PREV_UNKNOWN, np.uint16)
+                if NUMBA_AVAILABLE:
+                    # native whole-frame compose: static indices + satellite
+                    # blit; the satellite then rides the ordinary diff and
+                    # needs no direct emission or prev poking
+                    sidx, smask = sat_planes[frame_index]
+                    compose_frame(canvas_idx, frame_idx, sidx, smask,
+                                  sat_h, sat_w, sat_top, sat_left, sh, sw)
+                    cur = frame_idx
+                else:
+                    cur = canvas_idx
+                changed = np.nonzero(cur != prev)[0]
+                cur_sgr = b""
+                last_i = -2
+                for i, v in zip(changed.tolist(), cur[changed].tolist()):
+                    r, c = divmod(i, sw)
+                    sgr, ch = cell_palette[v]
+                    if i != last_i + 1 or c == 0:
+                        out.append(ROW_CUP[r] + COL_H[c])
+                    if sgr != cur_sgr:
+                        # a new SGR fully replaces the old background, so
+                        # no reset is needed between two colored runs
+                        out.append(sgr if sgr else RESET_B)
+                        cur_sgr = sgr
+                    out.append(ch)
+                    last_i = i
+                if cur_sgr:
+                    out.append(RESET_B)
+                prev[changed] = cur[changed]
+            else:
+                if prev is None:
+                    prev = [None] * (sh * sw)
+                for r in range(sh):
+                    rowbase = r * sw
+                    cur_sgr = b""  # terminal is in default state between rows
+                    last_c = -2
+                    for c in range(sw):
+                        i = rowbase + c
+                        cellv = canvas[i]
+                        if cellv != prev[i]:
+                            sgr, ch = cellv
+                            if c != last_c + 1:
+                                out.append(ROW_CUP[r] + COL_H[c])
+                            if sgr != cur_sgr:
+                                # a new SGR fully replaces the old background,
+                                # so no reset is needed between colored runs
+                                out.append(sgr if sgr else RESET_B)
+                                cur_sgr = sgr
+                            out.append(ch)
+                            last_c = c
+                            prev[i] = cellv
+                    if cur_sgr:
+                        out.append(RESET_B)
+            if not NUMBA_AVAILABLE:
+                # Satellite goes straight to the output as a few colored bars
+                # (one CUP + SGR + run + reset per segment); the prev cells it
+                # covers are blanked so the background reappears when it moves
+                emit_sprite(out, prev, sat_bars[frame_index], sat_top,
+                            sat_left, sh, sw, ROW_CUP, COL_H,
+                            PREV_UNKNOWN if NUMPY_AVAILABLE else None)
+            if out:
+                # cells are bytes already: join and write, no encode pass
+                sys.stdout.buffer.write(b"".join(out))
+                sys.stdout.buffer.flush()
+
+            # Frame pacing: sleep until the next absolute deadline
+            deadline += PERIOD_NS
+            sleep_ns = deadline - time.monotonic_ns()
+            if sleep_ns > 0:
+                time.sleep(sleep_ns / 1e9)
+            else:
+                deadline = time.monotonic_ns()  # behind schedule: resync
 
     finally:
         # Restore terminal
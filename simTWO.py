@@ -1,12 +1,14 @@
-import sys, os, time, tty, termios, select
+import sys, os, time, tty, termios
 
 # --- Retro Palette Configuration ---
-T_LG = "\033[48;2;120;220;120m" # Light Green (Head/Highlights)
-T_DG = "\033[48;2;40;140;40m"   # Dark Green (Body/Shadows)
-S_LB = "\033[48;2;160;110;40m"  # Light Brown (Shell Pattern)
-S_DB = "\033[48;2;90;60;20m"    # Dark Brown (Shell Base)
-BG   = "\033[48;2;20;40;20m"    # Dark Moss Background
-RESET = "\033[0m"
+# Escapes are kept as bytes so frames can be assembled into a bytearray and
+# written to sys.stdout.buffer without a per-frame str->utf-8 encode pass.
+T_LG = b"\033[48;2;120;220;120m" # Light Green (Head/Highlights)
+T_DG = b"\033[48;2;40;140;40m"   # Dark Green (Body/Shadows)
+S_LB = b"\033[48;2;160;110;40m"  # Light Brown (Shell Pattern)
+S_DB = b"\033[48;2;90;60;20m"    # Dark Brown (Shell Base)
+BG   = b"\033[48;2;20;40;20m"    # Dark Moss Background
+RESET = b"\033[0m"
 
 # Bitmap Legend: 0: BG, 1: Head, 2: Dark Body, 3: Shell Base, 4: Shell Pattern, 5: Eye
 SPRITE_FRAME_A = [
@@ -29,34 +31,84 @@ SPRITE_FRAME_B = [
     [2,0,0,0,2,0,0,0]
 ]
 
+# Cells are (sgr_prefix, char) pairs so the renderer can set the color once
+# per run of same-colored cells instead of set+reset for every cell
 COLOR_MAP = {
-    0: f"{BG} {RESET}",
-    1: f"{T_LG} {RESET}",
-    2: f"{T_DG} {RESET}",
-    3: f"{S_DB} {RESET}",
-    4: f"{S_LB} {RESET}",
-    5: "\033[48;2;255;255;255m\033[38;2;0;0;0m.\033[0m" # White eye with black pupil
+    0: (BG, b" "),
+    1: (T_LG, b" "),
+    2: (T_DG, b" "),
+    3: (S_DB, b" "),
+    4: (S_LB, b" "),
+    5: (b"\033[48;2;255;255;255m\033[38;2;0;0;0m", b".") # White eye with black pupil
 }
 
+# Precompiled sprite frames: opaque pixels only, as (dy, dx, cell) triples
+# relative to the turtle anchor. Skips the per-pixel bounds/transparency
+# checks and COLOR_MAP lookups in the draw loop.
+SPRITE_A_CELLS = [(r - 3, c - 4, COLOR_MAP[v])
+                  for r, row in enumerate(SPRITE_FRAME_A)
+                  for c, v in enumerate(row) if v != 0]
+SPRITE_B_CELLS = [(r - 3, c - 4, COLOR_MAP[v])
+                  for r, row in enumerate(SPRITE_FRAME_B)
+                  for c, v in enumerate(row) if v != 0]
+
+
 class AdvancedRetroTurtle:
     def __init__(self):
         self.rows, self.cols = os.get_terminal_size().lines - 1, os.get_terminal_size().columns
         self.tx, self.ty = self.cols // 2, self.rows // 2
         self.frame = 0
         self.moving = False
+        # shadow of what is on screen; cells start unknown -> first draw paints all
+        self.prev = [[None for _ in range(self.cols)] for _ in range(self.rows)]
+        self.last_sig = None  # signature of the last rendered frame
+        # pre-encoded CUP fragments: row_cup[r] + col_h[c] == b"\033[<r+1>;<c+1>H"
+        self.row_cup = [b"\033[%d;" % (r + 1) for r in range(self.rows)]
+        self.col_h = [b"%dH" % (c + 1) for c in range(self.cols)]
 
     def draw(self):
+        cells = SPRITE_B_CELLS if (self.frame & 1 == 0 and self.moving) else SPRITE_A_CELLS
+
+        # nothing visible changed since the last frame -> skip rebuild + emit
+        sig = (self.ty, self.tx, cells is SPRITE_B_CELLS)
+        if sig == self.last_sig:
+            return
+        self.last_sig = sig
+
         buffer = [[COLOR_MAP[0] for _ in range(self.cols)] for _ in range(self.rows)]
-        sprite = SPRITE_FRAME_B if (self.frame % 2 == 0 and self.moving) else SPRITE_FRAME_A
 
-        for r, row_data in enumerate(sprite):
-            for c, val in enumerate(row_data):
-                py, px = self.ty + r - 3, self.tx + c - 4
-                if 0 <= py < self.rows and 0 <= px < self.cols:
-                    if val != 0: buffer[py][px] = COLOR_MAP[val]
+        for dy, dx, s in cells:
+            py, px = self.ty + dy, self.tx + dx
+            if 0 <= py < self.rows and 0 <= px < self.cols:
+                buffer[py][px] = s
 
-        sys.stdout.write("\033[H" + "\n".join("".join(row) for row in buffer))
-        sys.stdout.flush()
+        # emit only the cells that changed since the last frame, keeping the
+        # SGR sticky across a run of same-colored cells
+        out = bytearray()
+        for r in range(self.rows):
+            brow, prow = buffer[r], self.prev[r]
+            cur_sgr = b""   # terminal is in default state between rows
+            last_c = -2
+            for c in range(self.cols):
+                cell = brow[c]
+                if cell != prow[c]:
+                    sgr, ch = cell
+                    if c != last_c + 1:
+                        out += self.row_cup[r] + self.col_h[c]
+                    if sgr != cur_sgr:
+                        # a new bg SGR fully replaces the old one, so no
+                        # reset is needed between two colored runs
+                        out += sgr if sgr else RESET
+                        cur_sgr = sgr
+                    out += ch
+                    last_c = c
+                    prow[c] = cell
+            if cur_sgr:
+                out += RESET
+        if out:
+            # one buffered write + flush: no encode pass, no partial writes
+            sys.stdout.buffer.write(out)
+            sys.stdout.buffer.flush()
 
 def main():
     sim = AdvancedRetroTurtle()
@@ -64,12 +116,22 @@ def main():
     old_settings = termios.tcgetattr(fd)
     try:
         tty.setcbreak(fd)
-        sys.stdout.write("\033[2J\033[?25l")
+        # VMIN=0/VTIME=0: os.read returns immediately with b"" when no key
+        # is pending, so input costs one syscall instead of select()+read()
+        attrs = termios.tcgetattr(fd)
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        sys.stdout.buffer.write(b"\033[2J\033[?25l")
+        sys.stdout.buffer.flush()
+        # absolute-deadline pacing on the monotonic integer clock
+        PERIOD_NS = 20_000_000  # ~50 Hz
+        deadline = time.monotonic_ns()
         while True:
             sim.draw()
             sim.moving = False
-            if select.select([sys.stdin], [], [], 0.05)[0]:
-                key = sys.stdin.read(3)
+            key = os.read(fd, 8).decode(errors="ignore")
+            if key:
                 sim.moving = True
                 sim.frame += 1
                 if key == '\x1b[A': sim.ty -= 1
@@ -77,10 +139,16 @@ def main():
                 elif key == '\x1b[C': sim.tx += 1
                 elif key == '\x1b[D': sim.tx -= 1
                 elif 'q' in key.lower(): break
-            time.sleep(0.02)
+            deadline += PERIOD_NS
+            sleep_ns = deadline - time.monotonic_ns()
+            if sleep_ns > 0:
+                time.sleep(sleep_ns / 1e9)
+            else:
+                deadline = time.monotonic_ns()  # behind schedule: resync
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        sys.stdout.write("\033[?25h\n")
+        sys.stdout.buffer.write(b"\033[?25h\n")
+        sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
     main()